@@ -12,11 +12,11 @@ if %errorlevel% neq 0 (
 
 REM Install required dependencies
 echo Installing required Python dependencies...
-pip install pyinstaller pillow pandas openpyxl --quiet
+pip install pyinstaller pillow pandas python-calamine xlsxwriter --quiet
 
 REM Build the executable
 echo Building the executable...
-pyinstaller --onefile --noconsole --add-data "%ICON%;." %SCRIPT%
+pyinstaller --onefile --noconsole --hidden-import python_calamine --hidden-import xlsxwriter --add-data "%ICON%;." %SCRIPT%
 
 REM Check if the build succeeded
 if exist dist\%SCRIPT:~0,-3%.exe (
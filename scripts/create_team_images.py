@@ -11,10 +11,22 @@
 # python3 script_name.py --help
 # Options include setting input file name, output directory,
 # enabling/disabling console logging, and specifying a log file.
+#
+# Rendering is faster with Pillow-SIMD, a drop-in replacement for Pillow
+# with vectorised paste/copy and resampling on x86:
+# pip uninstall pillow && pip install pillow-simd
 
 import logging
 import argparse
+import functools
+import hashlib
+import json
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from logging import getLogger
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 import os
 import sys
@@ -27,6 +39,18 @@ DEFAULT_FONT_SIZE = 300
 DEFAULT_TEXT_COLOUR = "#000033"
 DEFAULT_PADDING = 400
 DEFAULT_LINE_SPACING = 20
+DEFAULT_COMPRESS_LEVEL = 1
+WRITE_BUFFER_SIZE = 1024 * 1024
+WRITE_QUEUE_SIZE = 8
+STAMP_FILENAME = ".stamps.json"
+
+# Spaces become underscores and brackets are dropped in output file names
+FILENAME_TRANSLATION = str.maketrans({" ": "_", "(": None, ")": None})
+
+# Pillow-SIMD releases carry a ".postN" suffix on the upstream Pillow version
+PILLOW_SIMD = "post" in PIL.__version__
+
+logger = getLogger(__name__)
 
 # Configure logging
 def configure_logging(log_file=None, force_console=False):
@@ -36,6 +60,10 @@ def configure_logging(log_file=None, force_console=False):
     :param log_file: Path to the log file (optional).
     :param force_console: Force logging to console even if log file is specified.
     """
+    # Only configure the root logger once so repeated calls don't stack handlers
+    if logging.getLogger().handlers:
+        return getLogger(__name__)
+
     # Define colour codes for different log levels
     log_colors = {
         'DEBUG': '\033[1;34m',  # Blue
@@ -50,8 +78,8 @@ def configure_logging(log_file=None, force_console=False):
         Custom formatter to add colours to log levels and format log messages.
         """
         def format(self, record):
-            log_color = log_colors.get(record.levelname, '\033[0m')  # Default to no colour
-            record.levelname = f"{log_color}{record.levelname}\033[0m"
+            # Colour via a separate attribute so the level name itself is left untouched
+            record.levelcolor = log_colors.get(record.levelname, '\033[0m')  # Default to no colour
             return super().format(record)
 
     # Format string for logs
@@ -60,7 +88,7 @@ def configure_logging(log_file=None, force_console=False):
         "\033[1;34m%(filename)s\033[0m - "
         "\033[1;33m%(funcName)s\033[0m - "
         "\033[1;36m%(lineno)d\033[0m - "
-        "%(levelname)s - %(message)s"
+        "%(levelcolor)s%(levelname)s\033[0m - %(message)s"
     )
     formatter = CustomFormatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
 
@@ -88,10 +116,356 @@ def validate_file(file_path, description="file"):
         logger.error(f"The specified {description} does not exist: {file_path}")
         sys.exit(1)
 
+# Load a font, falling back to the default font if it cannot be read
+@functools.lru_cache(maxsize=None)
+def load_font(font_path, font_size):
+    """
+    Loads a TrueType font, caching the result for each path and size.
+
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :return: The loaded font, or the default font if loading fails.
+    """
+    try:
+        font = ImageFont.truetype(font_path, font_size)
+        logger.debug(f"Font loaded: {font_path} with size {font_size}")
+    except IOError:
+        logger.error("Failed to load font. Using default font.")
+        font = ImageFont.load_default()
+    return font
+
+# Measure text, caching the result for repeated strings
+@functools.lru_cache(maxsize=1024)
+def get_text_bbox(font_path, font_size, text):
+    """
+    Returns the bounding box of the text when drawn with the given font.
+
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :param text: Text to measure.
+    :return: Bounding box as (left, top, right, bottom).
+    """
+    return load_font(font_path, font_size).getbbox(text)
+
+# Rasterise a repeated line of text, such as a coach's name, once
+@functools.lru_cache(maxsize=16)
+def get_text_mask(font_path, font_size, text):
+    """
+    Renders the text into a greyscale mask cropped to its bounding box.
+
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :param text: Text to render.
+    :return: Tuple of the mask image and its (left, top) offset from the text origin.
+    """
+    left, top, right, bottom = get_text_bbox(font_path, font_size, text)
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text(
+        (-left, -top), text, font=load_font(font_path, font_size), fill=255
+    )
+    return mask, (left, top)
+
+# Stamp a line of text onto an image in a solid colour
+def draw_text_line(image, xy, text, font_path, font_size, fill_color):
+    """
+    Draws a line of text that repeats across teams using its cached mask.
+
+    :param image: Image to draw on.
+    :param xy: Position of the text origin.
+    :param text: Text to draw.
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :param fill_color: Colour of the text.
+    """
+    mask, (left, top) = get_text_mask(font_path, font_size, text)
+    image.paste(fill_color, (xy[0] + left, xy[1] + top), mask)
+
+# Name the image for a team based on its text
+def get_output_filename(output_dir, clean_text):
+    """
+    Builds the path of the image generated for a team.
+
+    :param output_dir: Directory the generated images are saved to.
+    :param clean_text: Team name with surrounding whitespace removed.
+    :return: Path of the team's image.
+    """
+    return os.path.join(output_dir, clean_text.translate(FILENAME_TRANSLATION) + ".png")
+
+# Fingerprint the settings that change how the images look
+def get_render_stamp(base_image_path, font_path, font_size, fill_color):
+    """
+    Hashes the render settings so a change to any of them forces a full re-render.
+
+    :param base_image_path: Path to the base image.
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :param fill_color: Colour of the text.
+    :return: Hex digest of the settings.
+    """
+    base_stat = os.stat(base_image_path)
+    settings = (
+        f"{os.path.abspath(base_image_path)}|{base_stat.st_size}|{base_stat.st_mtime_ns}|"
+        f"{os.path.abspath(font_path)}|{font_size}|{fill_color}"
+    )
+    return hashlib.sha1(settings.encode("utf-8")).hexdigest()
+
+# Find the teams whose images are missing or out of date
+def get_stale_teams(teams_list, output_dir, source_paths, stamps, stamp):
+    """
+    Filters out teams whose image was rendered with the current settings
+    and is newer than every source file.
+
+    :param teams_list: List of team names.
+    :param output_dir: Directory the generated images are saved to.
+    :param source_paths: Files the images are generated from.
+    :param stamps: Render stamp of each existing image, keyed by file name.
+    :param stamp: Render stamp for the current settings.
+    :return: List of team names that need rendering.
+    """
+    source_mtime = max(os.path.getmtime(path) for path in source_paths)
+    stale_teams = []
+    for text in teams_list:
+        output_filename = get_output_filename(output_dir, text.strip())
+        if (
+            stamps.get(os.path.basename(output_filename)) == stamp
+            and os.path.isfile(output_filename)
+            and os.path.getmtime(output_filename) >= source_mtime
+        ):
+            logger.debug(f"Skipping up-to-date image: {output_filename}")
+        else:
+            stale_teams.append(text)
+    return stale_teams
+
+# Read the render stamps recorded for the images in an output directory
+def load_render_stamps(stamp_path):
+    """
+    Loads the render stamp of each image, keyed by file name.
+
+    :param stamp_path: Path to the stamps file.
+    :return: Dictionary of file name to render stamp (empty if the file is missing or unreadable).
+    """
+    try:
+        with open(stamp_path, "r") as f:
+            stamps = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stamps if isinstance(stamps, dict) else {}
+
+# Write the render stamps for the images in an output directory
+def save_render_stamps(stamp_path, stamps):
+    """
+    Saves the render stamps, replacing the file only once it is completely written.
+
+    :param stamp_path: Path to the stamps file.
+    :param stamps: Dictionary of file name to render stamp.
+    """
+    temp_path = f"{stamp_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+    os.replace(temp_path, stamp_path)
+
+# Split a team name into the lines drawn under the base image
+def split_team_text(clean_text):
+    """
+    Splits a team name so any bracketed part goes on a second line.
+
+    :param clean_text: Team name with surrounding whitespace removed.
+    :return: Tuple of the first and second lines (the second may be empty).
+    """
+    head, sep, tail = clean_text.partition("(")
+    line1 = head.strip()
+    line2 = f"({tail.strip()}" if sep else ""
+    return line1, line2
+
+# Work out how much space the text needs below the base image
+def get_text_padding(line1, line2, font_path, font_size):
+    """
+    Calculates the height of the text block and the padding added for it.
+
+    :param line1: First line of text.
+    :param line2: Second line of text (may be empty).
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :return: Tuple of the total text height and the padding.
+    """
+    line1_height = get_text_bbox(font_path, font_size, line1)[3]
+    line2_height = get_text_bbox(font_path, font_size, line2)[3] if line2 else 0
+
+    total_text_height = (
+        line1_height + line2_height + DEFAULT_LINE_SPACING
+    )  # Add extra padding between lines
+    padding = max(DEFAULT_PADDING, total_text_height + 50)  # Ensure enough space
+    return total_text_height, padding
+
+# Per-process state shared by every image rendered in that process
+_worker_state = {}
+
+# Prepare a process for rendering team images
+def init_worker(shared_name, mode, size):
+    """
+    Attaches to the shared base image so every team rendered by this process can reuse it.
+
+    :param shared_name: Name of the shared memory block holding the decoded base image.
+    :param mode: Pillow mode of the base image pixels.
+    :param size: Size of the base image as (width, height).
+    """
+    shared_base = shared_memory.SharedMemory(name=shared_name)
+    _worker_state["shared_base"] = shared_base
+    # Wrap the already-decoded pixels without copying them
+    _worker_state["base_image"] = Image.frombuffer(mode, size, shared_base.buf, "raw", mode, 0, 1)
+    # Blank canvases with the base image already pasted, keyed by padding
+    _worker_state["templates"] = {}
+
+# Release the shared base image held by this process
+def release_worker():
+    """
+    Drops the canvases and detaches from the shared base image.
+    """
+    shared_base = _worker_state.pop("shared_base")
+    # The base image wraps the shared buffer, so it must go before the block is closed
+    _worker_state.clear()
+    shared_base.close()
+
+# Get the blank canvas for a padding, building it the first time it is needed
+def get_template(padding):
+    """
+    Returns the base image on a white canvas extended by the padding.
+
+    :param padding: Space added below the base image for the text.
+    :return: The canvas, shared by every team with the same padding.
+    """
+    templates = _worker_state["templates"]
+    template = templates.get(padding)
+    if template is None:
+        base_image = _worker_state["base_image"]
+        template = Image.new("RGB", (base_image.width, base_image.height + padding), "white")
+        template.paste(base_image, (0, 0))
+        templates[padding] = template
+    return template
+
+# Render the image for a single team
+def render_team_image(text, output_dir, font_path, font_size, fill_color):
+    """
+    Overlays a single team name onto the base image.
+
+    :param text: Team name to overlay on the image.
+    :param output_dir: Directory the generated image will be saved to.
+    :param font_path: Path to the font file.
+    :param font_size: Font size for the text.
+    :param fill_color: Colour of the text.
+    :return: Tuple of the rendered image and the path it should be saved to.
+    """
+    image_width, image_height = _worker_state["base_image"].size
+
+    # Clean up the string and split it into lines if necessary
+    clean_text = text.strip()
+    line1, line2 = split_team_text(clean_text)
+
+    # Calculate text positions
+    _, _, line1_width, line1_height = get_text_bbox(font_path, font_size, line1)
+    line2_width = get_text_bbox(font_path, font_size, line2)[2] if line2 else 0
+
+    total_text_height, padding = get_text_padding(line1, line2, font_path, font_size)
+
+    # Add space for the text by copying the prepared canvas
+    final_image = get_template(padding).copy()
+
+    # Adjust vertical positions for both lines
+    text_start_y = image_height + (padding - total_text_height) // 2
+
+    # Draw text centred at the bottom. The team name is unique, so draw it directly
+    line1_x = (image_width - line1_width) // 2
+    ImageDraw.Draw(final_image).text(
+        (line1_x, text_start_y), line1, font=load_font(font_path, font_size), fill=fill_color
+    )
+
+    # The bracketed second line repeats across a coach's teams, so stamp its cached mask
+    if line2:
+        line2_x = (image_width - line2_width) // 2
+        line2_y = text_start_y + line1_height + DEFAULT_LINE_SPACING
+        draw_text_line(final_image, (line2_x, line2_y), line2, font_path, font_size, fill_color)
+
+    return final_image, get_output_filename(output_dir, clean_text)
+
+# Save a rendered image as a PNG
+def save_image(final_image, output_filename, compress_level=DEFAULT_COMPRESS_LEVEL):
+    """
+    Writes the image through a large buffer so PNG chunks reach the disk in few writes.
+    The image is written to a temporary file first and only moved into place once
+    complete, so a failed save never leaves a partial PNG behind.
+
+    :param final_image: Image to save.
+    :param output_filename: Path to save the image to.
+    :param compress_level: PNG compression level, from 0 (fastest) to 9 (smallest).
+    """
+    temp_filename = f"{output_filename}.{os.getpid()}.tmp"
+    try:
+        with open(temp_filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            final_image.save(f, format="PNG", optimize=False, compress_level=compress_level)
+        os.replace(temp_filename, output_filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+# Render and save the image for a single team
+def save_team_image(text, compress_level, **render_args):
+    """
+    Renders a single team image and saves it straight away.
+
+    :param text: Team name to overlay on the image.
+    :param compress_level: PNG compression level.
+    :param render_args: Keyword arguments passed on to render_team_image.
+    :return: Tuple of the saved image's path, the worker's process ID and
+        the worker's text measurement cache (hits, misses) so far.
+    """
+    final_image, output_filename = render_team_image(text, **render_args)
+    save_image(final_image, output_filename, compress_level)
+    cache_info = get_text_bbox.cache_info()
+    return output_filename, os.getpid(), (cache_info.hits, cache_info.misses)
+
+# Log how well text measurements were reused
+def log_cache_stats(cache_infos):
+    """
+    Logs the combined text measurement cache statistics of every process that rendered images.
+
+    :param cache_infos: Cache (hits, misses) from each rendering process.
+    """
+    hits = sum(info[0] for info in cache_infos)
+    misses = sum(info[1] for info in cache_infos)
+    lookups = hits + misses
+    hit_rate = hits / lookups if lookups else 0
+    logger.debug(
+        f"Text measurement cache: {hits} hits, {misses} misses ({hit_rate:.0%} hit rate) "
+        f"across {len(cache_infos)} process(es)"
+    )
+
+# Save images from a queue in the background
+def image_writer(write_queue, compress_level, failed_saves):
+    """
+    Saves queued (image, path) pairs until a None sentinel is received.
+
+    :param write_queue: Queue of images waiting to be saved.
+    :param compress_level: PNG compression level.
+    :param failed_saves: List the paths of images that could not be saved are added to.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        final_image, output_filename = item
+        try:
+            save_image(final_image, output_filename, compress_level)
+            logger.info(f"Saved: {output_filename}")
+        except Exception as e:
+            logger.error(f"Failed to save {output_filename}: {e}", exc_info=True)
+            failed_saves.append(output_filename)
+
 # Function to generate images with text
 def generate_images(
     base_image_path, output_dir, teams_list, font_path=DEFAULT_FONT_PATH,
-    font_size=DEFAULT_FONT_SIZE, fill_color=DEFAULT_TEXT_COLOUR
+    font_size=DEFAULT_FONT_SIZE, fill_color=DEFAULT_TEXT_COLOUR, workers=None,
+    compress_level=DEFAULT_COMPRESS_LEVEL, force=False
 ):
     """
     Generates images by overlaying text onto a base image.
@@ -102,83 +476,125 @@ def generate_images(
     :param font_path: Path to the font file.
     :param font_size: Font size for the text.
     :param fill_color: Colour of the text.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param compress_level: PNG compression level, from 0 (fastest) to 9 (smallest).
+    :param force: Re-render every image even if it is already up to date.
     """
     logger.info("Starting image generation process")
+    if PILLOW_SIMD:
+        logger.debug(f"Using Pillow-SIMD {PIL.__version__}")
+    else:
+        logger.debug(f"Using Pillow {PIL.__version__}; install pillow-simd for faster rendering")
 
     try:
         # Validate the input file
         validate_file(base_image_path, "input image")
         validate_file(font_path, "font file")
 
-        # Load the base image
-        base_image = Image.open(base_image_path)
-        image_width, image_height = base_image.size
-        logger.debug(f"Base image loaded with size: {image_width}x{image_height}")
-
-        # Prepare the font
-        try:
-            font = ImageFont.truetype(font_path, font_size)
-            logger.debug(f"Font loaded: {font_path} with size {font_size}")
-        except IOError:
-            logger.error("Failed to load font. Using default font.")
-            font = ImageFont.load_default()
-
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
         logger.debug(f"Output directory ensured: {output_dir}")
 
-        for text in teams_list:
-            logger.info(f"Processing text: {text}")
-            # Clean up the string and split it into lines if necessary
-            clean_text = text.strip()
-            if "(" in clean_text:
-                line1, line2 = clean_text.split("(", 1)
-                line1 = line1.strip()
-                line2 = f"({line2.strip()}"
-            else:
-                line1 = clean_text
-                line2 = ""
-
-            # Create a copy of the base image and prepare to draw
-            output_image = base_image.copy()
-            draw = ImageDraw.Draw(output_image)
-
-            # Calculate text positions
-            line1_width, line1_height = font.getbbox(line1)[2], font.getbbox(line1)[3]
-            line2_width, line2_height = (
-                font.getbbox(line2)[2], font.getbbox(line2)[3]
-            ) if line2 else (0, 0)
-
-            total_text_height = (
-                line1_height + (line2_height if line2 else 0) + DEFAULT_LINE_SPACING
-            )  # Add extra padding between lines
-            padding = max(DEFAULT_PADDING, total_text_height + 50)  # Ensure enough space
-
-            # Add space for the text
-            new_image_height = image_height + padding
-            final_image = Image.new("RGB", (image_width, new_image_height), "white")
-            final_image.paste(output_image, (0, 0))
-
-            # Adjust vertical positions for both lines
-            text_start_y = image_height + (padding - total_text_height) // 2
-
-            # Draw text centred at the bottom
-            line1_x = (image_width - line1_width) // 2
-            draw = ImageDraw.Draw(final_image)
-            draw.text((line1_x, text_start_y), line1, font=font, fill=fill_color)
-
-            if line2:
-                line2_x = (image_width - line2_width) // 2
-                line2_y = text_start_y + line1_height + DEFAULT_LINE_SPACING
-                draw.text((line2_x, line2_y), line2, font=font, fill=fill_color)
-
-            # Save the image with a filename based on the text
-            output_filename = os.path.join(
-                output_dir,
-                clean_text.replace(" ", "_").replace("(", "").replace(")", "") + ".png"
+        # Only re-render images that are older than their sources or were rendered
+        # with different settings
+        stamp_path = os.path.join(output_dir, STAMP_FILENAME)
+        stamp = get_render_stamp(base_image_path, font_path, font_size, fill_color)
+        stamps = load_render_stamps(stamp_path)
+        if not force:
+            teams_list = get_stale_teams(
+                teams_list, output_dir, (base_image_path, font_path), stamps, stamp
             )
-            final_image.save(output_filename)
-            logger.info(f"Saved: {output_filename}")
+        if not teams_list:
+            logger.info("All images are up to date")
+            return
+
+        # Decode the base image once; workers read its pixels from shared memory.
+        # RGBA is one of the modes Image.frombuffer can map without copying.
+        base_image = Image.open(base_image_path)
+        if base_image.mode != "RGBA":
+            base_image = base_image.convert("RGBA")
+        base_image_data = base_image.tobytes()
+        logger.debug(f"Base image loaded with size: {base_image.width}x{base_image.height}")
+
+        # Load the font here so any fallback is logged by the parent, not a worker
+        load_font(font_path, font_size)
+
+        render_args = dict(
+            output_dir=output_dir, font_path=font_path,
+            font_size=font_size, fill_color=fill_color
+        )
+
+        saved_files = []
+        failed_saves = []
+        shared_base = shared_memory.SharedMemory(create=True, size=len(base_image_data))
+        try:
+            shared_base.buf[:len(base_image_data)] = base_image_data
+            del base_image_data
+            worker_args = (shared_base.name, base_image.mode, base_image.size)
+
+            # Each team is independent, so spread them across processes
+            workers = min(workers or os.cpu_count() or 1, len(teams_list))
+            logger.debug(f"Rendering {len(teams_list)} images with {workers} worker(s)")
+            if workers > 1:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=init_worker, initargs=worker_args
+                ) as executor:
+                    # Workers may not share this process's logging setup (e.g. under
+                    # the spawn start method), so all progress is logged from here
+                    futures = []
+                    for text in teams_list:
+                        logger.info(f"Processing text: {text}")
+                        futures.append(executor.submit(
+                            save_team_image, text, compress_level=compress_level, **render_args
+                        ))
+                    # Keep going past failures, like the in-process writer thread does.
+                    # Each result carries its worker's cumulative cache statistics, so the
+                    # largest seen from each worker is that worker's total.
+                    worker_cache_infos = {}
+                    for text, future in zip(teams_list, futures):
+                        try:
+                            output_filename, worker_pid, cache_info = future.result()
+                            worker_cache_infos[worker_pid] = max(
+                                cache_info, worker_cache_infos.get(worker_pid, (0, 0))
+                            )
+                            logger.info(f"Saved: {output_filename}")
+                            saved_files.append(output_filename)
+                        except Exception as e:
+                            logger.error(f"Failed to save image for {text}: {e}", exc_info=True)
+                            failed_saves.append(get_output_filename(output_dir, text.strip()))
+                    log_cache_stats(list(worker_cache_infos.values()))
+            else:
+                # Render the next image while a background thread saves the previous one
+                init_worker(*worker_args)
+                write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+                writer = threading.Thread(
+                    target=image_writer, args=(write_queue, compress_level, failed_saves)
+                )
+                writer.start()
+                queued_files = []
+                try:
+                    for text in teams_list:
+                        logger.info(f"Processing text: {text}")
+                        final_image, output_filename = render_team_image(text, **render_args)
+                        write_queue.put((final_image, output_filename))
+                        queued_files.append(output_filename)
+                finally:
+                    write_queue.put(None)
+                    writer.join()
+                    saved_files.extend(f for f in queued_files if f not in failed_saves)
+                    cache_info = get_text_bbox.cache_info()
+                    log_cache_stats([(cache_info.hits, cache_info.misses)])
+                    release_worker()
+        finally:
+            shared_base.close()
+            shared_base.unlink()
+
+        # Record the settings each saved image was rendered with
+        for output_filename in saved_files:
+            stamps[os.path.basename(output_filename)] = stamp
+        save_render_stamps(stamp_path, stamps)
+        if failed_saves:
+            logger.error(f"{len(failed_saves)} image(s) could not be saved")
 
     except Exception as e:
         logger.error(f"An error occurred: {e}", exc_info=True)
@@ -211,6 +627,18 @@ def main():
         "--fill_color", type=str, default=DEFAULT_TEXT_COLOUR,
         help=f"Colour of the text (default: {DEFAULT_TEXT_COLOUR})"
     )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Number of worker processes used to render images (default: CPU count)"
+    )
+    parser.add_argument(
+        "--compress_level", type=int, default=DEFAULT_COMPRESS_LEVEL, choices=range(10),
+        help=f"PNG compression level, 0 (fastest) to 9 (smallest) (default: {DEFAULT_COMPRESS_LEVEL})"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-render every image even if it is already up to date"
+    )
     parser.add_argument(
         "--log_file", type=str, help="Path to the log file (optional)"
     )
@@ -246,7 +674,10 @@ def main():
         teams_list=teams_list,
         font_path=args.font,
         font_size=args.font_size,
-        fill_color=args.fill_color
+        fill_color=args.fill_color,
+        workers=args.workers,
+        compress_level=args.compress_level,
+        force=args.force
     )
 
 if __name__ == "__main__":
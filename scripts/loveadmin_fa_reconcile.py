@@ -1,4 +1,5 @@
 import pandas as pd
+import xlsxwriter
 import logging
 from logging import getLogger
 
@@ -10,6 +11,10 @@ def configure_logging(log_file=None, force_console=False):
     :param log_file: Path to the log file (optional).
     :param force_console: Force logging to console even if log file is specified.
     """
+    # Only configure the root logger once so repeated calls don't stack handlers
+    if logging.getLogger().handlers:
+        return getLogger(__name__)
+
     # Define colour codes for different log levels
     log_colors = {
         'DEBUG': '\033[1;34m',  # Blue
@@ -24,8 +29,8 @@ def configure_logging(log_file=None, force_console=False):
         Custom formatter to add colours to log levels and format log messages.
         """
         def format(self, record):
-            log_color = log_colors.get(record.levelname, '\033[0m')  # Default to no colour
-            record.levelname = f"{log_color}{record.levelname}\033[0m"
+            # Colour via a separate attribute so the level name itself is left untouched
+            record.levelcolor = log_colors.get(record.levelname, '\033[0m')  # Default to no colour
             return super().format(record)
 
     # Format string for logs
@@ -34,7 +39,7 @@ def configure_logging(log_file=None, force_console=False):
         "\033[1;34m%(filename)s\033[0m - "
         "\033[1;33m%(funcName)s\033[0m - "
         "\033[1;36m%(lineno)d\033[0m - "
-        "%(levelname)s - %(message)s"
+        "%(levelcolor)s%(levelname)s\033[0m - %(message)s"
     )
     formatter = CustomFormatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
 
@@ -51,7 +56,36 @@ def configure_logging(log_file=None, force_console=False):
     return getLogger(__name__)
 
 
-logger = configure_logging(force_console=True)
+logger = getLogger(__name__)
+
+
+def save_merged_data(merged_data, output_path):
+    """
+    Saves the merged data, streaming rows to Excel so the workbook is never held in memory.
+
+    :param merged_data: Merged DataFrame to save.
+    :param output_path: Path to save the file to; a .csv extension writes CSV instead of Excel.
+    """
+    if output_path.lower().endswith(".csv"):
+        merged_data.to_csv(output_path, index=False)
+        return
+
+    # constant_memory flushes each row once written, so rows must be written in order
+    workbook = xlsxwriter.Workbook(output_path, {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss"
+    })
+    try:
+        worksheet = workbook.add_worksheet("Merged")
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        worksheet.write_row(0, 0, [str(col) for col in merged_data.columns], header_format)
+
+        for row_number, row in enumerate(merged_data.itertuples(index=False, name=None), start=1):
+            # Blank out missing values, which xlsxwriter cannot write as numbers
+            worksheet.write_row(row_number, 0, [None if pd.isna(value) else value for value in row])
+    finally:
+        workbook.close()
 
 
 def merge_datasets(loveadmin_path, fa_club_portal_path, output_path):
@@ -64,32 +98,49 @@ def merge_datasets(loveadmin_path, fa_club_portal_path, output_path):
     """
     try:
         logger.info("Loading LoveAdmin data...")
-        loveadmin_data = pd.read_excel(loveadmin_path)
+        loveadmin_data = pd.read_excel(loveadmin_path, engine="calamine")
 
         logger.info("Loading FA Club Portal data...")
-        fa_club_portal_data = pd.read_excel(fa_club_portal_path, skiprows=6)
+        fa_club_portal_data = pd.read_excel(fa_club_portal_path, skiprows=6, engine="calamine")
 
         logger.debug("Renaming columns for standardisation...")
         loveadmin_data = loveadmin_data.rename(columns={"Last name": "Surname", "First name": "First names"})
 
-        logger.debug("Adding presence flags...")
-        loveadmin_data["In_LoveAdmin"] = True
-        fa_club_portal_data["In_FA_Club_Portal"] = True
+        logger.debug("Normalising name keys...")
+        for data in (loveadmin_data, fa_club_portal_data):
+            # Cast first: a column read entirely blank comes back as float
+            data["_k1"] = data["First names"].astype("string").str.strip().str.casefold()
+            data["_k2"] = data["Surname"].astype("string").str.strip().str.casefold()
+
+        # Only the name columns get a suffix; other shared columns keep pandas' default _x/_y
+        fa_club_portal_data = fa_club_portal_data.rename(
+            columns={"First names": "First names_FA", "Surname": "Surname_FA"}
+        )
 
         logger.info("Merging datasets...")
         merged_data = pd.merge(
             loveadmin_data,
             fa_club_portal_data,
-            on=["First names", "Surname"],
-            how="outer"
+            on=["_k1", "_k2"],
+            how="outer",
+            indicator=True
         )
 
-        logger.debug("Filling NaN values for presence flags...")
-        merged_data["In_LoveAdmin"] = merged_data["In_LoveAdmin"].fillna(False)
-        merged_data["In_FA_Club_Portal"] = merged_data["In_FA_Club_Portal"].fillna(False)
+        logger.debug("Filling names and presence flags...")
+        for column in ("First names", "Surname"):
+            merged_data[column] = merged_data[column].fillna(merged_data.pop(f"{column}_FA"))
+        merged_data["In_LoveAdmin"] = merged_data["_merge"].isin(["left_only", "both"])
+        merged_data["In_FA_Club_Portal"] = merged_data["_merge"].isin(["right_only", "both"])
+        merged_data = merged_data.drop(columns=["_k1", "_k2", "_merge"])
+
+        logger.debug("Moving name columns first...")
+        fixed_columns = ["First names", "Surname"]
+        fixed_set = set(fixed_columns)
+        other_columns = [col for col in merged_data.columns if col not in fixed_set]
+        merged_data = merged_data.reindex(columns=fixed_columns + other_columns)
 
         logger.info(f"Saving merged data to {output_path}...")
-        merged_data.to_excel(output_path, index=False)
+        save_merged_data(merged_data, output_path)
 
         logger.info("Merge process completed successfully.")
 
@@ -99,6 +150,8 @@ def merge_datasets(loveadmin_path, fa_club_portal_path, output_path):
 
 
 if __name__ == "__main__":
+    logger = configure_logging(force_console=True)
+
     # Paths to the files
     loveadmin_file = "Data export 20250124-162359.xlsx"
     fa_club_portal_file = "Wilpshire Wanderers_RegistrationReport_24012025.xlsx"
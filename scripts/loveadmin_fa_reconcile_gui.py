@@ -1,55 +1,47 @@
+import hashlib
+import os
 import pandas as pd
-import logging
 from logging import getLogger
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import Image
+from loveadmin_fa_reconcile import configure_logging, save_merged_data
 
 
-def configure_logging(log_file=None, force_console=False):
+logger = getLogger(__name__)
+
+
+def get_cached_logo(logo_path, size=(100, 100)):
     """
-    Configures logging for the script. Logs to a file if specified, or to the console otherwise.
+    Returns the path of a resized copy of the logo, resizing only when the cached copy is missing or stale.
 
-    :param log_file: Path to the log file (optional).
-    :param force_console: Force logging to console even if log file is specified.
+    :param logo_path: Path to the full-size logo.
+    :param size: Size of the logo shown in the window.
+    :return: Path to the resized logo.
     """
-    log_colors = {
-        'DEBUG': '\033[1;34m',  # Blue
-        'INFO': '\033[1;32m',   # Green
-        'WARNING': '\033[1;33m',  # Yellow
-        'ERROR': '\033[1;31m',  # Red
-        'CRITICAL': '\033[1;41m'  # Red background
-    }
-
-    class CustomFormatter(logging.Formatter):
-        def format(self, record):
-            log_color = log_colors.get(record.levelname, '\033[0m')
-            record.levelname = f"{log_color}{record.levelname}\033[0m"
-            return super().format(record)
-
-    log_format = (
-        "\033[1;37m%(asctime)s\033[0m - "
-        "\033[1;34m%(filename)s\033[0m - "
-        "\033[1;33m%(funcName)s\033[0m - "
-        "\033[1;36m%(lineno)d\033[0m - "
-        "%(levelname)s - %(message)s"
+    # Key the cache by the source logo so different logos never share a cached copy
+    source_key = hashlib.sha1(os.path.abspath(logo_path).encode("utf-8")).hexdigest()[:16]
+    cache_path = os.path.join(
+        os.path.expanduser("~"), ".wwfc", f"logo_{source_key}_{size[0]}x{size[1]}.png"
     )
-    formatter = CustomFormatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
-
-    handlers = []
-    if log_file:
-        handlers.append(logging.FileHandler(log_file))
-    if not log_file or force_console:
-        handlers.append(logging.StreamHandler())
-
-    for handler in handlers:
-        handler.setFormatter(formatter)
-
-    logging.basicConfig(level=logging.DEBUG, handlers=handlers)
-    return getLogger(__name__)
-
-
-logger = configure_logging(force_console=True)
+    if os.path.isfile(cache_path) and (
+        not os.path.isfile(logo_path) or os.path.getmtime(cache_path) >= os.path.getmtime(logo_path)
+    ):
+        return cache_path
+
+    logger.debug(f"Caching resized logo at {cache_path}...")
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Write to a temporary file first so an interrupted save can't leave a corrupt cache
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with Image.open(logo_path) as logo:
+            logo.resize(size, Image.Resampling.LANCZOS).save(temp_path, format="PNG", optimize=True)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return cache_path
 
 
 def merge_datasets_gui():
@@ -65,7 +57,9 @@ def merge_datasets_gui():
         fa_club_portal_file_var.set(file_path)
 
     def save_output_file():
-        file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel Files", "*.xlsx")])
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx", filetypes=[("Excel Files", "*.xlsx"), ("CSV Files", "*.csv")]
+        )
         output_file_var.set(file_path)
 
     def show_help():
@@ -82,10 +76,10 @@ def merge_datasets_gui():
 
         try:
             logger.info("Loading LoveAdmin data...")
-            loveadmin_data = pd.read_excel(loveadmin_file)
+            loveadmin_data = pd.read_excel(loveadmin_file, engine="calamine")
 
             logger.info("Loading FA Club Portal data...")
-            fa_club_portal_data = pd.read_excel(fa_club_portal_file, skiprows=6)
+            fa_club_portal_data = pd.read_excel(fa_club_portal_file, skiprows=6, engine="calamine")
 
             if "Last name" not in loveadmin_data.columns or "First name" not in loveadmin_data.columns:
                 raise ValueError("LoveAdmin file does not contain required columns: 'Last name', 'First name'.")
@@ -96,31 +90,44 @@ def merge_datasets_gui():
             logger.debug("Renaming columns for standardisation...")
             loveadmin_data = loveadmin_data.rename(columns={"Last name": "Surname", "First name": "First names"})
 
-            logger.debug("Adding presence flags...")
-            loveadmin_data["In_LoveAdmin"] = True
-            fa_club_portal_data["In_FA_Club_Portal"] = True
+            logger.debug("Normalising name keys...")
+            for data in (loveadmin_data, fa_club_portal_data):
+                # Cast first: a column read entirely blank comes back as float
+                data["_k1"] = data["First names"].astype("string").str.strip().str.casefold()
+                data["_k2"] = data["Surname"].astype("string").str.strip().str.casefold()
+
+            # Only the name columns get a suffix; other shared columns keep pandas' default _x/_y
+            fa_club_portal_data = fa_club_portal_data.rename(
+                columns={"First names": "First names_FA", "Surname": "Surname_FA"}
+            )
 
             logger.info("Merging datasets...")
             merged_data = pd.merge(
                 loveadmin_data,
                 fa_club_portal_data,
-                on=["First names", "Surname"],
-                how="outer"
+                on=["_k1", "_k2"],
+                how="outer",
+                indicator=True
             )
 
-            logger.debug("Filling NaN values for presence flags...")
-            merged_data["In_LoveAdmin"] = merged_data["In_LoveAdmin"].fillna(False)
-            merged_data["In_FA_Club_Portal"] = merged_data["In_FA_Club_Portal"].fillna(False)
+            logger.debug("Filling names and presence flags...")
+            for column in ("First names", "Surname"):
+                merged_data[column] = merged_data[column].fillna(merged_data.pop(f"{column}_FA"))
+            merged_data["In_LoveAdmin"] = merged_data["_merge"].isin(["left_only", "both"])
+            merged_data["In_FA_Club_Portal"] = merged_data["_merge"].isin(["right_only", "both"])
+            merged_data = merged_data.drop(columns=["_k1", "_k2", "_merge"])
 
             logger.debug("Reordering columns...")
-            columns_order = [
+            fixed_columns = [
                 "First names", "Surname",  # Common columns
                 "In_LoveAdmin", "In_FA_Club_Portal", "Team", "Active mandates"  # Specific columns in desired order
-            ] + [col for col in merged_data.columns if col not in columns_order]
-            merged_data = merged_data[columns_order]
+            ]
+            fixed_set = set(fixed_columns)
+            other_columns = [col for col in merged_data.columns if col not in fixed_set]
+            merged_data = merged_data.reindex(columns=fixed_columns + other_columns)
 
             logger.info(f"Saving merged data to {output_file}...")
-            merged_data.to_excel(output_file, index=False)
+            save_merged_data(merged_data, output_file)
 
             messagebox.showinfo("Success", "Merge completed successfully.")
             logger.info("Merge process completed successfully.")
@@ -137,9 +144,8 @@ def merge_datasets_gui():
     # Add logo
     logo_path = "/mnt/data/U5-6_Leaflet_2024-1-400x400.png"
     try:
-        logo = Image.open(logo_path)
-        logo = logo.resize((100, 100), Image.LANCZOS)
-        logo = ImageTk.PhotoImage(logo)
+        # Tk reads the cached PNG directly, so startup skips decoding and resizing the original
+        logo = tk.PhotoImage(file=get_cached_logo(logo_path))
         tk.Label(root, image=logo, bg="#1E90FF").grid(row=0, column=0, columnspan=3, pady=10)
     except Exception as e:
         logger.error(f"Unable to load logo: {e}")
@@ -177,4 +183,5 @@ def merge_datasets_gui():
 
 
 if __name__ == "__main__":
+    configure_logging(force_console=True)
     merge_datasets_gui()